@@ -1,11 +1,61 @@
+from __future__ import annotations
+
 import os
 import sys
+import copy
+import stat
 import yaml
-import requests
-from collections import OrderedDict
-from typing import Optional, Tuple
+import hashlib
+from io import BytesIO
+from contextlib import closing
+from typing import TYPE_CHECKING, Optional, Tuple
 from importlib.util import spec_from_file_location, module_from_spec
-from streamlit import sidebar
+import streamlit as st
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+if TYPE_CHECKING:
+    import requests
+
+# Shared HTTP session so repeated remote YAML fetches reuse pooled keep-alive connections.
+# Created on first use, so apps loading activities from disk never import `requests`.
+_HTTP: Optional[requests.Session] = None
+
+# Two-level YAML cache: each path maps its last seen (st_mtime_ns, st_size) to a BLAKE2b digest of the
+# file contents, and each (path, digest) maps to the parsed data. Touching a file without changing its
+# contents costs a read and a hash, but no parse. Only the current digest of each path is kept.
+_MTIME_TO_HASH: dict[str, tuple[int, int, bytes]] = {}
+_HASH_TO_PARSED: dict[tuple[str, bytes], dict] = {}
+
+
+def clear_activities_cache() -> None:
+    """
+    Clears the cached YAML files and activities dictionaries, forcing them to be re-read on the next call.
+    """
+    _MTIME_TO_HASH.clear()
+    _HASH_TO_PARSED.clear()
+    _cached_activities.clear()
+
+
+def _http_session() -> requests.Session:
+    """
+    Returns the shared HTTP session, creating it on the first call.
+
+    Returns:
+        requests.Session: A session with a pooled, retrying adapter mounted on `https://`.
+    """
+    global _HTTP
+    if _HTTP is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        _HTTP = requests.Session()
+        _HTTP.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(total=2, backoff_factor=0.1)))
+    return _HTTP
 
 
 def load_yaml(filepath: str) -> dict:
@@ -16,6 +66,10 @@ def load_yaml(filepath: str) -> dict:
         python load_yaml.py --filepath /file/path/to/filename.yaml
         python load_yaml.py --filepath http://example.com/path/to/filename.yaml
 
+    Local files are cached by path and only re-read when their modification time or size changes,
+    and only re-parsed when their contents change; use `clear_activities_cache` to force a reload.
+    Each call returns a fresh copy, so callers may modify the result.
+
     Args:
         filepath (str): The absolute path to the YAML file or a URL to the YAML file.
 
@@ -24,53 +78,117 @@ def load_yaml(filepath: str) -> dict:
 
     Raises:
         FileNotFoundError: If the file does not exist.
+        Exception: If the YAML file can not be fetched from the URL.
         yaml.YAMLError: If there is an error while loading the YAML file.
     """
-    if filepath.startswith('http://') or filepath.startswith('https://'):
+    if filepath.startswith(('http://', 'https://')):
+        import requests  # Deferred: only needed for remote files, and cached in `sys.modules` afterwards
+        from urllib3.exceptions import HTTPError as URLLib3HTTPError
+
         try:
-            response = requests.get(filepath)
-            response.raise_for_status()  # Raises a HTTPError if the response status is 4xx, 5xx
-            yaml_data = yaml.safe_load(response.text)
-        except (requests.RequestException, yaml.YAMLError) as e:
-            raise Exception(f'Error loading YAML from `{filepath}`. \n {str(e)}')
-        else:
-            return yaml_data
+            response = _http_session().get(filepath, timeout=(3.05, 10), stream=True)
+        except requests.RequestException as e:
+            raise Exception(f'Error loading YAML from `{filepath}`. \n {str(e)}') from e
+
+        with closing(response):  # Releases the connection back to the pool
+            try:
+                response.raise_for_status()  # Raises a HTTPError if the response status is 4xx, 5xx
+            except requests.HTTPError as e:
+                raise Exception(f'Error loading YAML from `{filepath}`. \n {str(e)}') from e
+
+            # Let the parser read the (decompressed) body directly instead of buffering `response.text`
+            response.raw.decode_content = True
+            try:
+                return yaml.load(response.raw, Loader=_SafeLoader)
+            except URLLib3HTTPError as e:  # The body is read while parsing, outside of requests' error wrapping
+                raise Exception(f'Error loading YAML from `{filepath}`. \n {str(e)}') from e
     else:
-        if not os.path.isfile(filepath):
+        try:
+            file_stat = os.stat(filepath)
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"No such file or directory: '{filepath}'") from e
+
+        if not stat.S_ISREG(file_stat.st_mode):
             raise FileNotFoundError(f"No such file or directory: '{filepath}'")
 
-        with open(filepath, 'r') as file_descriptor:
-            try:
-                yaml_data = yaml.safe_load(file_descriptor)
-            except yaml.YAMLError as msg:
-                raise yaml.YAMLError(f'File `{filepath}` loading error. \n {msg}')
-            else:
-                return yaml_data
+        file_key = (file_stat.st_mtime_ns, file_stat.st_size)
+        cached = _MTIME_TO_HASH.get(filepath)
+        if cached is not None and cached[:2] == file_key:
+            parsed = _HASH_TO_PARSED.get((filepath, cached[2]))
+            if parsed is not None:
+                return copy.deepcopy(parsed)
+
+        with open(filepath, 'rb') as file_descriptor:
+            data = file_descriptor.read()
+
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        if cached is not None and cached[2] != digest:
+            _HASH_TO_PARSED.pop((filepath, cached[2]), None)
+        _MTIME_TO_HASH[filepath] = (*file_key, digest)
+        parsed = _HASH_TO_PARSED.get((filepath, digest))
+        if parsed is not None:
+            return copy.deepcopy(parsed)
+
+        # Parse from the bytes already read; the stream name keeps the file path in error marks
+        stream = BytesIO(data)
+        stream.name = filepath
+        try:
+            yaml_data = yaml.load(stream, Loader=_SafeLoader)
+        except yaml.YAMLError as msg:
+            raise yaml.YAMLError(f'File `{filepath}` loading error. \n {msg}')
+        else:
+            _HASH_TO_PARSED[(filepath, digest)] = yaml_data
+            return copy.deepcopy(yaml_data)
 
 
-def get_available_activities(activities_filepath: str) -> OrderedDict:
+def get_available_activities(activities_filepath: str) -> Optional[dict[str, dict]]:
     """
     Retrieves available activities from a yaml file. These activities can be used to
     create a multi-page app using Streamlit. 
 
     Args:
         activities_filepath (str): The absolute path to the yaml file containing the activites (Pages).
+                                   It is used as given, so callers should resolve it (e.g. with `os.path.abspath`) once.
 
     Returns:
-        OrderedDict: An ordered dictionary of services if any are available. 
-                     The dictionary is ordered based on the order of activities in the `yaml` file.
-                     Each key-value pair corresponds to a service name and its associated information.
-                     Returns None if the `yaml` file does not contain any activities.
+        dict: A dictionary of services if any are available. 
+              The dictionary is ordered based on the order of activities in the `yaml` file.
+              Each key-value pair corresponds to a service name and its associated information.
+              Returns None if the `yaml` file does not contain any activities.
+              Results are memoized with `st.cache_data` until the file is modified.
     Raises:
         FileNotFoundError: If the `activities_filepath` does not exist.
     """
-    if not os.path.isfile(activities_filepath):
+    try:
+        file_stat = os.stat(activities_filepath)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"No such file or directory: '{activities_filepath}'") from e
+
+    if not stat.S_ISREG(file_stat.st_mode):
         raise FileNotFoundError(f"No such file or directory: '{activities_filepath}'")
 
-    available_services = load_yaml(filepath=os.path.abspath(activities_filepath))
+    return _cached_activities(activities_filepath, file_stat.st_mtime_ns)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_activities(activities_filepath: str, mtime_ns: int) -> Optional[dict[str, dict]]:
+    """
+    Builds the activities dictionary for `get_available_activities`, memoized by Streamlit across reruns and sessions.
+
+    The modification time is part of the cache key, so editing the file invalidates the entry.
+    Use `_cached_activities.clear()` (or `clear_activities_cache`) to drop all entries explicitly.
+
+    Args:
+        activities_filepath (str): The absolute path to the yaml file containing the activites (Pages).
+        mtime_ns (int): The modification time of the file in nanoseconds.
+
+    Returns:
+        Optional[dict[str, dict]]: The activities dictionary, or None if the `yaml` file does not contain any activities.
+    """
+    available_services = load_yaml(filepath=activities_filepath)
 
     if available_services:
-        services_dict = OrderedDict({service['name']: service for service in available_services})
+        services_dict = {service['name']: service for service in available_services}
         return services_dict
 
     return None
@@ -98,15 +216,21 @@ def _script_as_module(module_filepath: str, activities_dirpath: str) -> bool:
         raise TypeError(f"`activities_dirpath` must be a string, not {type(activities_dirpath).__name__}")
     if not isinstance(module_filepath, str):
         raise TypeError(f"`module_filepath` must be a string, not {type(module_filepath).__name__}")
-    if not os.path.isdir(activities_dirpath):
-        raise NotADirectoryError(f"No such directory: '{activities_dirpath}'")
 
     abs_module_filepath = os.path.join(activities_dirpath, module_filepath)
 
-    if not os.path.isfile(abs_module_filepath):
+    # A single stat on the module covers the common case; the directory is only checked on failure
+    try:
+        module_stat = os.stat(abs_module_filepath)
+    except (FileNotFoundError, NotADirectoryError) as e:
+        if not os.path.isdir(activities_dirpath):
+            raise NotADirectoryError(f"No such directory: '{activities_dirpath}'") from e
+        raise FileNotFoundError(f"No such file: '{abs_module_filepath}'") from e
+
+    if not stat.S_ISREG(module_stat.st_mode):
         raise FileNotFoundError(f"No such file: '{abs_module_filepath}'")
 
-    module_name = os.path.basename(abs_module_filepath).replace('.py', '')
+    module_name = os.path.splitext(os.path.basename(abs_module_filepath))[0]
 
     spec = spec_from_file_location(name=module_name, location=abs_module_filepath, submodule_search_locations=[activities_dirpath])
 
@@ -124,38 +248,37 @@ def _script_as_module(module_filepath: str, activities_dirpath: str) -> bool:
 
 
 def build_activities_menu(
-    activities_dict: OrderedDict[str, dict], 
+    activities_dict: dict[str, dict], 
     label: str, 
     key: str, 
     activities_dirpath: str, 
     disabled: bool = False
-) -> Tuple[Optional[str], OrderedDict[str, dict]]:
+) -> Tuple[Optional[str], dict[str, dict]]:
     """
     Builds an interactive activities menu using Streamlit's sidebar selectbox.
 
     Args:
-        activities_dict (OrderedDict[str, dict]): An ordered dictionary of activities. Each key-value pair corresponds to a 
-                                                  service name and its associated information.
+        activities_dict (dict[str, dict]): A dictionary of activities, in menu order. Each key-value pair corresponds to a 
+                                           service name and its associated information.
         label (str): The label to display above the select box.
         key (str): A unique identifier for the select box widget.
-        activities_dirpath (str): The directory path where the service resides.
+        activities_dirpath (str): The absolute directory path where the service resides. It is used as given.
         disabled (bool, optional): Whether the select box is disabled. Defaults to False.
 
     Returns:
-        Tuple[Optional[str], OrderedDict[str, dict]]: The selected activity name and the dictionary of activities. 
-                                                      If no activity is selected, the first item in the tuple is None.
+        Tuple[Optional[str], dict[str, dict]]: The selected activity name and the dictionary of activities. 
+                                               If no activity is selected, the first item in the tuple is None.
 
     Raises:
         ValueError: If any activity in activities_dict does not have both `name` and `url`
     """
-    # Validate that each activity has both 'name' and 'url'
-    for task_dict in activities_dict.values():
-        if 'name' not in task_dict or 'url' not in task_dict:
-            raise ValueError("Each activity dict must have both 'name' and 'url'")
-
-    activity_names = [(task_dict['name'], task_dict['url']) for task_dict in activities_dict.values()]
+    # Validate that each activity has both 'name' and 'url' while building the options
+    try:
+        activity_names = tuple((task_dict['name'], task_dict['url']) for task_dict in activities_dict.values())
+    except KeyError as e:
+        raise ValueError("Each activity dict must have both 'name' and 'url'") from e
 
-    selection_tuple = sidebar.selectbox(
+    selection_tuple = st.sidebar.selectbox(
         label=label,
         index=0,
         options=activity_names,
@@ -28,14 +28,14 @@ def run():
 
     # Load the yaml with core services as activities    
     core_activities =  get_available_activities(
-        activities_filepath=os.path.abspath(ACTIVITIES_FILEPATH)        
+        activities_filepath=ACTIVITIES_FILEPATH
     )
        
     build_activities_menu(
             activities_dict=core_activities, 
             label='**Activities:**', 
             key='activitiesMenu', 
-            activities_dirpath=os.path.abspath(ACTIVITIES_DIRPATH),
+            activities_dirpath=ACTIVITIES_DIRPATH,
             disabled=False
             )
 
@@ -0,0 +1,96 @@
+import os
+
+import pytest
+
+import streamlit_activities_menu as activities_menu
+from streamlit_activities_menu import clear_activities_cache, load_yaml
+
+ACTIVITIES_YAML = """
+-
+  name: 'Main'
+  url: "main.py"
+"""
+ACTIVITIES = [{'name': 'Main', 'url': 'main.py'}]
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_activities_cache()
+    yield
+    clear_activities_cache()
+
+
+@pytest.fixture
+def activities_filepath(tmp_path):
+    filepath = tmp_path / 'app_activities.yaml'
+    filepath.write_text(ACTIVITIES_YAML)
+    return str(filepath)
+
+
+@pytest.fixture
+def parse_calls(monkeypatch):
+    """Records every call to `yaml.load` made by `load_yaml`."""
+    calls = []
+    yaml_load = activities_menu.yaml.load
+
+    def counting_load(*args, **kwargs):
+        calls.append(args)
+        return yaml_load(*args, **kwargs)
+
+    monkeypatch.setattr(activities_menu.yaml, 'load', counting_load)
+    return calls
+
+
+def _shift_mtime(filepath: str, seconds: int = 10) -> None:
+    file_stat = os.stat(filepath)
+    os.utime(filepath, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + seconds * 10**9))
+
+
+def test_warm_hit_returns_equal_copy(activities_filepath, parse_calls):
+    first = load_yaml(activities_filepath)
+    second = load_yaml(activities_filepath)
+
+    assert first == second == ACTIVITIES
+    assert second is not first
+    assert len(parse_calls) == 1
+
+    second[0]['name'] = 'Changed'
+    assert load_yaml(activities_filepath) == ACTIVITIES
+
+
+def test_edit_invalidates_entry(activities_filepath, parse_calls):
+    load_yaml(activities_filepath)
+
+    with open(activities_filepath, 'a') as file_descriptor:
+        file_descriptor.write("-\n  name: 'Map'\n  url: \"map.py\"\n")
+    _shift_mtime(activities_filepath)
+
+    assert load_yaml(activities_filepath) == ACTIVITIES + [{'name': 'Map', 'url': 'map.py'}]
+    assert len(parse_calls) == 2
+    assert len(activities_menu._HASH_TO_PARSED) == 1
+
+
+def test_touch_without_changes_does_not_reparse(activities_filepath, parse_calls):
+    load_yaml(activities_filepath)
+    _shift_mtime(activities_filepath)
+
+    assert load_yaml(activities_filepath) == ACTIVITIES
+    assert len(parse_calls) == 1
+    assert activities_menu._MTIME_TO_HASH[activities_filepath][0] == os.stat(activities_filepath).st_mtime_ns
+
+
+def test_clear_activities_cache_resets_both_levels(activities_filepath, parse_calls):
+    load_yaml(activities_filepath)
+    assert activities_menu._MTIME_TO_HASH and activities_menu._HASH_TO_PARSED
+
+    clear_activities_cache()
+
+    assert activities_menu._MTIME_TO_HASH == {}
+    assert activities_menu._HASH_TO_PARSED == {}
+    assert load_yaml(activities_filepath) == ACTIVITIES
+    assert len(parse_calls) == 2
+
+
+def test_directory_raises_file_not_found(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_yaml(str(tmp_path))